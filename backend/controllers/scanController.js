@@ -1,6 +1,7 @@
 // controllers/scanController.js
 const path = require('path');
 const fs = require('fs');
+const crypto = require('crypto');
 const axios = require('axios');
 const FormData = require('form-data');
 const Scan = require('../models/Scan');
@@ -10,7 +11,7 @@ const logger = require('../utils/logger');
 
 // Generate unique scan ID
 const generateScanId = () => {
-  return `scan_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+  return `scan_${Date.now()}_${crypto.randomBytes(4).toString('hex')}`;
 };
 
 /**
@@ -1,14 +1,60 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
+import aiofiles
+import asyncio
 import tempfile
 import os
 import re
+import fitz
 import PyPDF2
-import pdfplumber
-from typing import Dict, List
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict
+from parsers.resume_parser import extract_pdf_text, get_worker_pool, reset_worker_pool
 
-app = FastAPI(title="Vigyantra Resume Scanner", version="1.0.0")
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_RE = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+YEAR_RE = re.compile(r'(\d{4})\s*[-–—]\s*(\d{4})')
+
+# Common skill keywords looked for in resume text
+SKILL_KEYWORDS = (
+    'python', 'javascript', 'java', 'react', 'angular', 'node', 'express',
+    'mongodb', 'sql', 'mysql', 'postgresql', 'html', 'css', 'git',
+    'aws', 'docker', 'kubernetes', 'machine learning', 'data analysis',
+    'project management', 'leadership', 'communication', 'teamwork',
+    'warehouse', 'logistics', 'supply chain', 'inventory', 'packing',
+    'picking', 'shipping', 'cleaning', 'sanitation'
+)
+
+# Single-pass matcher over all skill keywords. A keyword may not start inside a longer word.
+# Short keywords must also not run into a following letter (so "awsome" is not "aws" and
+# "github" is not "git"), though a version number may follow ("CSS3"). Longer keywords may
+# carry any suffix, so "ReactJS", "Dockerized" and "HTML5" still match.
+SHORT_SKILL_LENGTH = 3
+SKILL_RE = re.compile(
+    r'(?<![a-z0-9])(' + '|'.join(
+        re.escape(skill) + (r'(?![a-z])' if len(skill) <= SHORT_SKILL_LENGTH else '')
+        for skill in sorted(SKILL_KEYWORDS, key=len, reverse=True)
+    ) + r')',
+    re.IGNORECASE
+)
+
+SUPPORTED_CONTENT_TYPES = frozenset([
+    'application/pdf',
+    'application/msword',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+])
+
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 16
+
+# Same 10MB limit as the backend upload middleware
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+# Allowance for the multipart framing around the file in Content-Length
+MAX_REQUEST_SIZE = MAX_UPLOAD_SIZE + UPLOAD_CHUNK_SIZE
+
+app = FastAPI(title="Vigyantra Resume Scanner", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Enable CORS
 app.add_middleware(
@@ -19,17 +65,50 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class UploadSizeLimitMiddleware:
+    """Reject request bodies over max_size before they are read in full, with or without Content-Length"""
+    def __init__(self, app, max_size: int):
+        self.app = app
+        self.max_size = max_size
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # Declared length: refuse before reading any of the body
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > self.max_size:
+            response = ORJSONResponse(status_code=413, content={"detail": "File too large"})
+            await response(scope, receive, send)
+            return
+        
+        # Chunked or understated length: count body bytes as the app pulls them
+        received = 0
+        
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_size:
+                    raise HTTPException(status_code=413, detail="File too large")
+            return message
+        
+        await self.app(scope, limited_receive, send)
+
+app.add_middleware(UploadSizeLimitMiddleware, max_size=MAX_REQUEST_SIZE)
+
 def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text from PDF using pdfplumber (better than PyPDF2)"""
+    """Extract text from PDF using PyMuPDF (MuPDF C engine, much faster than PyPDF2)"""
     text = ""
     try:
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+        with open(file_path, 'rb') as file:
+            pdf_bytes = file.read()
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            text = extract_pdf_text(doc, pdf_bytes)
         return text
-    except Exception as e:
+    except fitz.FileDataError:
         # Fallback to PyPDF2
         try:
             with open(file_path, 'rb') as file:
@@ -38,22 +117,21 @@ def extract_text_from_pdf(file_path: str) -> str:
                     text += page.extract_text() + "\n"
             return text
         except Exception as e2:
-            raise HTTPException(status_code=500, detail=f"Could not extract text: {str(e2)}")
+            # Runs in a worker process: raise something that pickles back to the parent
+            raise ValueError(f"Could not extract text: {str(e2)}")
 
 def extract_resume_info(text: str) -> Dict:
     """Extract key information from resume text"""
     # Email extraction
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
+    emails = EMAIL_RE.findall(text)
     
     # Phone extraction
-    phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-    phones = re.findall(phone_pattern, text)
+    phones = PHONE_RE.findall(text)
     
     # Extract name (first few lines usually contain name)
-    lines = text.split('\n')
+    lines = text.split('\n', 5)[:5]  # Only split off the first 5 lines
     name = ""
-    for line in lines[:5]:  # Check first 5 lines
+    for line in lines:
         line = line.strip()
         if len(line) > 2 and not '@' in line and not any(char.isdigit() for char in line):
             if len(line.split()) <= 4:  # Names usually 1-4 words
@@ -61,25 +139,12 @@ def extract_resume_info(text: str) -> Dict:
                 break
     
     # Extract skills (look for common skill keywords)
-    skill_keywords = [
-        'python', 'javascript', 'java', 'react', 'angular', 'node', 'express',
-        'mongodb', 'sql', 'mysql', 'postgresql', 'html', 'css', 'git',
-        'aws', 'docker', 'kubernetes', 'machine learning', 'data analysis',
-        'project management', 'leadership', 'communication', 'teamwork',
-        'warehouse', 'logistics', 'supply chain', 'inventory', 'packing',
-        'picking', 'shipping', 'cleaning', 'sanitation'
-    ]
-    
-    found_skills = []
-    text_lower = text.lower()
-    for skill in skill_keywords:
-        if skill in text_lower:
-            found_skills.append(skill.title())
+    matched = {match.group(1).lower() for match in SKILL_RE.finditer(text)}
+    found_skills = [skill.title() for skill in SKILL_KEYWORDS if skill in matched]
     
     # Experience extraction (look for years)
     experience_years = 0
-    year_pattern = r'(\d{4})\s*[-–—]\s*(\d{4})'
-    year_matches = re.findall(year_pattern, text)
+    year_matches = YEAR_RE.findall(text)
     if year_matches:
         total_months = 0
         for start, end in year_matches:
@@ -98,6 +163,18 @@ def extract_resume_info(text: str) -> Dict:
         "full_text": text[:500] + "..." if len(text) > 500 else text  # Truncate for response
     }
 
+def process_resume(file_path: str, content_type: str) -> Dict:
+    """Extract text and resume information from a saved upload (runs in a worker process)"""
+    # Extract text based on file type
+    if content_type == 'application/pdf':
+        extracted_text = extract_text_from_pdf(file_path)
+    else:
+        # For DOC/DOCX files, you'd use python-docx here
+        extracted_text = "DOC/DOCX processing not implemented yet"
+    
+    # Extract resume information
+    return extract_resume_info(extracted_text)
+
 @app.get("/")
 async def root():
     return {"message": "Vigyantra Resume Scanner is ready!"}
@@ -110,25 +187,35 @@ async def health():
 async def scan_resume(file: UploadFile = File(...)):
     try:
         # Validate file type
-        if not file.content_type in ['application/pdf', 'application/msword', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document']:
+        if not file.content_type in SUPPORTED_CONTENT_TYPES:
             raise HTTPException(status_code=400, detail="Only PDF, DOC, and DOCX files are supported")
         
-        # Save uploaded file temporarily
+        # Save uploaded file temporarily, streaming it in chunks so memory stays bounded
         with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
             tmp_file_path = tmp_file.name
         
         try:
-            # Extract text based on file type
-            if file.content_type == 'application/pdf':
-                extracted_text = extract_text_from_pdf(tmp_file_path)
-            else:
-                # For DOC/DOCX files, you'd use python-docx here
-                extracted_text = "DOC/DOCX processing not implemented yet"
+            file_size = 0
+            async with aiofiles.open(tmp_file_path, 'wb') as out_file:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    file_size += len(chunk)
+                    if file_size > MAX_UPLOAD_SIZE:
+                        raise HTTPException(status_code=413, detail="File too large")
+                    await out_file.write(chunk)
             
-            # Extract resume information
-            resume_data = extract_resume_info(extracted_text)
+            # Parse off the event loop so other uploads keep being served
+            loop = asyncio.get_running_loop()
+            pool = get_worker_pool()
+            try:
+                resume_data = await loop.run_in_executor(
+                    pool, process_resume, tmp_file_path, file.content_type
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=500, detail=str(e))
+            except BrokenProcessPool:
+                # A worker died (e.g. crashed or ran out of memory on a hostile PDF)
+                reset_worker_pool(pool)
+                raise HTTPException(status_code=500, detail="Processing failed: resume parser crashed")
             
             # Calculate risk score (simple example)
             risk_score = 15  # Low risk for this example
@@ -141,6 +228,7 @@ async def scan_resume(file: UploadFile = File(...)):
                 "success": True,
                 "filename": file.filename,
                 "file_type": file.content_type,
+                "file_size": file_size,
                 "candidate_info": resume_data["candidate_info"],
                 "extracted_skills": resume_data["extracted_skills"],
                 "experience_years": resume_data["experience_years"],
@@ -158,8 +246,15 @@ async def scan_resume(file: UploadFile = File(...)):
             # Clean up temporary file
             os.unlink(tmp_file_path)
             
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    # Set DEV=1 for a single auto-reloading process
+    dev = os.getenv("DEV") == "1"
+    workers = 1 if dev else os.cpu_count() or 1
+    # Split the cores between the server workers' parser pools
+    os.environ.setdefault("PARSER_POOL_WORKERS", str(max(1, (os.cpu_count() or 1) // workers)))
+    uvicorn.run("api:app", host="0.0.0.0", port=8000, reload=dev, workers=workers)
@@ -1,13 +1,76 @@
+import os
+import fitz
 import PyPDF2
 import docx
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from typing import Dict, List, Any
 
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+# Runs of non-delimiter characters after the literal scheme, minus trailing punctuation
+_URL_RE = re.compile(r'https?://[^\s<>"\'\])}]+(?<![.,;:!?])')
+_WORD_RE = re.compile(r'\S+')
+
+# PDFs with more pages than this are split across worker processes
+PARALLEL_PAGE_THRESHOLD = 2
+
+_worker_pool = None
+_in_worker = False
+
+def _mark_worker() -> None:
+    """Pool initializer so code running inside a worker does not spawn a nested pool"""
+    global _in_worker
+    _in_worker = True
+
+def get_worker_pool() -> ProcessPoolExecutor:
+    """Return the process-wide CPU worker pool, created on first use"""
+    global _worker_pool
+    if _worker_pool is None:
+        max_workers = int(os.getenv("PARSER_POOL_WORKERS") or os.cpu_count() or 1)
+        _worker_pool = ProcessPoolExecutor(max_workers=max_workers, initializer=_mark_worker)
+    return _worker_pool
+
+def reset_worker_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next get_worker_pool() starts a fresh one"""
+    global _worker_pool
+    # Concurrent requests may all see the same broken pool; only replace it once
+    if _worker_pool is pool:
+        _worker_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> List[str]:
+    """Extract text of pages [start, stop) in a worker process"""
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        return [doc[i].get_text("text") for i in range(start, stop)]
+
+def extract_pdf_text(doc: fitz.Document, pdf_bytes: bytes) -> str:
+    """Extract text from an open PDF, fanning pages out to worker processes for long documents"""
+    page_count = doc.page_count
+    # Inside a worker the pool is already busy with other requests, so extract serially
+    if page_count <= PARALLEL_PAGE_THRESHOLD or _in_worker:
+        return "\n".join(page.get_text("text") for page in doc)
+    
+    # One contiguous page range per worker so the PDF bytes are sent once per worker
+    workers = min(os.cpu_count() or 1, page_count)
+    step = -(-page_count // workers)
+    starts = range(0, page_count, step)
+    stops = [min(start + step, page_count) for start in starts]
+    pool = get_worker_pool()
+    try:
+        chunks = pool.map(_extract_page_range, repeat(pdf_bytes), starts, stops)
+        return "\n".join(text for chunk in chunks for text in chunk)
+    except BrokenProcessPool:
+        reset_worker_pool(pool)
+        raise
+
 class ResumeParser:
     def __init__(self):
-        self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        self.phone_pattern = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
-        self.url_pattern = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+        self.email_pattern = _EMAIL_RE
+        self.phone_pattern = _PHONE_RE
+        self.url_pattern = _URL_RE
         
     def parse_file(self, file_path: str, content_type: str) -> Dict[str, Any]:
         """Parse resume file and extract content"""
@@ -23,6 +86,41 @@ class ResumeParser:
         text = ""
         metadata = {}
         
+        try:
+            with open(file_path, 'rb') as file:
+                pdf_bytes = file.read()
+            
+            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+            try:
+                # Extract metadata
+                if doc.metadata:
+                    metadata = {
+                        'title': doc.metadata.get('title') or '',
+                        'author': doc.metadata.get('author') or '',
+                        'creator': doc.metadata.get('creator') or '',
+                        'producer': doc.metadata.get('producer') or '',
+                        'creation_date': doc.metadata.get('creationDate') or '',
+                        'modification_date': doc.metadata.get('modDate') or ''
+                    }
+                
+                # Extract text from all pages in reading order
+                text = extract_pdf_text(doc, pdf_bytes)
+            finally:
+                doc.close()
+                
+        except fitz.FileDataError:
+            # Fallback to PyPDF2 for files MuPDF cannot open
+            return self._parse_pdf_legacy(file_path)
+        except Exception as e:
+            raise Exception(f"PDF parsing failed: {str(e)}")
+        
+        return self._analyze_content(text, metadata)
+    
+    def _parse_pdf_legacy(self, file_path: str) -> Dict[str, Any]:
+        """Parse PDF file with PyPDF2"""
+        text = ""
+        metadata = {}
+        
         try:
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
@@ -91,7 +189,7 @@ class ResumeParser:
             },
             'statistics': {
                 'character_count': len(text),
-                'word_count': len(text.split()),
-                'line_count': len(text.split('\n'))
+                'word_count': sum(1 for _ in _WORD_RE.finditer(text)),
+                'line_count': text.count('\n') + 1
             }
         }
@@ -1,32 +1,75 @@
 import re
 import asyncio
+import contextvars
 import aiohttp
+from async_lru import alru_cache
 from urllib.parse import urlparse
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+# Runs of non-delimiter characters after the literal scheme, minus trailing punctuation
+_URL_RE = re.compile(r'https?://[^\s<>"\'\])}]+(?<![.,;:!?])')
+_IP_RE = re.compile(r'[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}')
+
+# Known malicious/suspicious domains (basic list)
+SUSPICIOUS_DOMAINS = frozenset([
+    'bit.ly',
+    'tinyurl.com',
+    'short.link',
+    'malware-test.com',
+    'phishing-test.com'
+])
+
+# Known URL shorteners
+SHORTENER_DOMAINS = frozenset(['bit.ly', 'tinyurl.com', 't.co', 'goo.gl', 'short.link'])
+
+# Known safe domains
+SAFE_DOMAINS = frozenset([
+    'linkedin.com',
+    'github.com',
+    'google.com',
+    'stackoverflow.com',
+    'medium.com'
+])
+
+def _domain_suffixes(host: str) -> frozenset:
+    """Return the host and each of its parent domains (www.github.com -> github.com, com)"""
+    labels = host.split('.')
+    return frozenset('.'.join(labels[i:]) for i in range(len(labels)))
+
+# Session of the scan that starts a probe, passed out of band so it is not part of the cache key
+_probe_session: contextvars.ContextVar[aiohttp.ClientSession] = contextvars.ContextVar('probe_session')
+_cache_loop = None
+
+def _bind_cache_to_loop() -> None:
+    """Drop cached probes made on another event loop, since they are bound to it"""
+    global _cache_loop
+    loop = asyncio.get_running_loop()
+    if _cache_loop is not loop:
+        _probe_domain.cache_clear()
+        _cache_loop = loop
+
+def _origin(parsed_url) -> str:
+    """Return scheme://host[:port] of a URL, leaving out any userinfo"""
+    host = (parsed_url.hostname or '').rstrip('.')
+    if ':' in host:
+        host = f'[{host}]'  # IPv6 literal
+    port = parsed_url.port
+    return f'{parsed_url.scheme}://{host}' + (f':{port}' if port else '')
+
+# Failed probes raise and are therefore not cached. Only the site root is probed, so a
+# dead deep link on a reachable site (https://gitlab.com/no-such-user) is reported safe.
+@alru_cache(maxsize=2048, ttl=3600)
+async def _probe_domain(origin: str) -> int:
+    """HEAD the site root and return its status, cached per scheme://host for an hour"""
+    async with _probe_session.get().head(origin) as response:
+        return response.status
 
 class LinkScanner:
     def __init__(self):
-        self.url_pattern = re.compile(
-            r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        )
-        
-        # Known malicious/suspicious domains (basic list)
-        self.suspicious_domains = [
-            'bit.ly',
-            'tinyurl.com',
-            'short.link',
-            'malware-test.com',
-            'phishing-test.com'
-        ]
-        
-        # Known safe domains
-        self.safe_domains = [
-            'linkedin.com',
-            'github.com',
-            'google.com',
-            'stackoverflow.com',
-            'medium.com'
-        ]
+        self.url_pattern = _URL_RE
+        self.suspicious_domains = SUSPICIOUS_DOMAINS
+        self.shortener_domains = SHORTENER_DOMAINS
+        self.safe_domains = SAFE_DOMAINS
     
     async def scan(self, parsed_content: Dict[str, Any]) -> Dict[str, Any]:
         """Scan URLs for security issues"""
@@ -38,9 +81,37 @@ class LinkScanner:
         if not urls:
             return {'vulnerabilities': []}
         
+        # Classify against known domain lists first so only unknown URLs hit the network
+        analyses = [self._classify_url(url) for url in urls]
+        unknown = [i for i, analysis in enumerate(analyses) if analysis is None]
+        
+        if unknown:
+            _bind_cache_to_loop()
+            
+            # One session per scan so all HEAD requests reuse the connection pool and DNS cache
+            async with aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=5),
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            ) as session:
+                token = _probe_session.set(session)
+                try:
+                    results = await asyncio.gather(
+                        *(self._analyze_url(urls[i]) for i in unknown),
+                        return_exceptions=True
+                    )
+                finally:
+                    _probe_session.reset(token)
+            for i, result in zip(unknown, results):
+                if isinstance(result, BaseException):
+                    result = {
+                        'is_suspicious': True,
+                        'severity': 'low',
+                        'reason': f'URL analysis failed: {str(result)}'
+                    }
+                analyses[i] = result
+        
         # Analyze each URL
-        for url in urls:
-            url_analysis = await self._analyze_url(url)
+        for url, url_analysis in zip(urls, analyses):
             if url_analysis['is_suspicious']:
                 vulnerabilities.append({
                     'type': 'Suspicious URL',
@@ -59,14 +130,16 @@ class LinkScanner:
             }
         }
     
-    async def _analyze_url(self, url: str) -> Dict[str, Any]:
-        """Analyze individual URL for security issues"""
+    def _classify_url(self, url: str) -> Optional[Dict[str, Any]]:
+        """Check URL against known domain lists, returns None when a network check is needed"""
         try:
             parsed_url = urlparse(url)
-            domain = parsed_url.netloc.lower()
+            # hostname drops userinfo and port and is lowercased; strip the trailing root dot
+            domain = (parsed_url.hostname or '').rstrip('.')
+            suffixes = _domain_suffixes(domain)
             
             # Check against known suspicious domains
-            if any(suspicious in domain for suspicious in self.suspicious_domains):
+            if not suffixes.isdisjoint(self.suspicious_domains):
                 return {
                     'is_suspicious': True,
                     'severity': 'high',
@@ -74,8 +147,7 @@ class LinkScanner:
                 }
             
             # Check for URL shorteners
-            shortener_domains = ['bit.ly', 'tinyurl.com', 't.co', 'goo.gl', 'short.link']
-            if any(shortener in domain for shortener in shortener_domains):
+            if not suffixes.isdisjoint(self.shortener_domains):
                 return {
                     'is_suspicious': True,
                     'severity': 'medium',
@@ -83,7 +155,7 @@ class LinkScanner:
                 }
             
             # Check for suspicious URL patterns
-            if re.search(r'[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}', domain):
+            if _IP_RE.search(domain):
                 return {
                     'is_suspicious': True,
                     'severity': 'medium',
@@ -91,39 +163,42 @@ class LinkScanner:
                 }
             
             # Check for safe domains
-            if any(safe in domain for safe in self.safe_domains):
+            if not suffixes.isdisjoint(self.safe_domains):
                 return {
                     'is_suspicious': False,
                     'severity': 'none',
                     'reason': 'URL uses known safe domain'
                 }
             
-            # Try to verify URL accessibility (with timeout)
-            try:
-                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
-                    async with session.head(url) as response:
-                        if response.status >= 400:
-                            return {
-                                'is_suspicious': True,
-                                'severity': 'low',
-                                'reason': f'URL returns error status: {response.status}'
-                            }
-            except:
+            return None
+            
+        except Exception as e:
+            return {
+                'is_suspicious': True,
+                'severity': 'low',
+                'reason': f'URL analysis failed: {str(e)}'
+            }
+    
+    async def _analyze_url(self, url: str) -> Dict[str, Any]:
+        """Verify accessibility of a URL not covered by the known domain lists"""
+        # Try to verify URL accessibility (with timeout)
+        try:
+            status = await _probe_domain(_origin(urlparse(url)))
+            if status >= 400:
                 return {
                     'is_suspicious': True,
                     'severity': 'low',
-                    'reason': 'URL is not accessible or takes too long to respond'
+                    'reason': f'URL returns error status: {status}'
                 }
-            
-            return {
-                'is_suspicious': False,
-                'severity': 'none',
-                'reason': 'URL appears to be safe'
-            }
-            
-        except Exception as e:
+        except:
             return {
                 'is_suspicious': True,
                 'severity': 'low',
-                'reason': f'URL analysis failed: {str(e)}'
+                'reason': 'URL is not accessible or takes too long to respond'
             }
+        
+        return {
+            'is_suspicious': False,
+            'severity': 'none',
+            'reason': 'URL appears to be safe'
+        }
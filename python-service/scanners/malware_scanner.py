@@ -1,21 +1,51 @@
-import os
-import hashlib
 import re
+from collections import Counter
 from typing import Dict, List, Any
 
+# Known malicious patterns and signatures
+_BINARY_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in [
+        rb'cmd\.exe',
+        rb'powershell',
+        rb'eval\(',
+        rb'<script',
+        rb'javascript:',
+        rb'vbscript:',
+        rb'file:///',
+        rb'\\\\[^\\s]+\\',  # UNC paths
+    ]
+]
+
+# Script injection attempts
+_SCRIPT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in [
+        r'<script[^>]*>.*?</script>',
+        r'javascript:',
+        r'vbscript:',
+        r'data:text/html',
+        r'eval\s*\(',
+        r'document\.write\s*\(',
+    ]
+]
+
+# Command injection attempts
+_COMMAND_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in [
+        r'cmd\.exe',
+        r'powershell',
+        r'bash\s+-c',
+        r'sh\s+-c',
+        r'system\s*\(',
+        r'exec\s*\(',
+    ]
+]
+
 class MalwareScanner:
     def __init__(self):
         # Known malicious patterns and signatures
-        self.suspicious_patterns = [
-            rb'cmd\.exe',
-            rb'powershell',
-            rb'eval\(',
-            rb'<script',
-            rb'javascript:',
-            rb'vbscript:',
-            rb'file:///',
-            rb'\\\\[^\\s]+\\',  # UNC paths
-        ]
+        self.suspicious_patterns = _BINARY_PATTERNS
+        self.script_patterns = _SCRIPT_PATTERNS
+        self.command_patterns = _COMMAND_PATTERNS
         
         # Suspicious metadata patterns
         self.suspicious_metadata = [
@@ -42,13 +72,16 @@ class MalwareScanner:
         text_issues = self._scan_text_content(parsed_content.get('text', ''))
         vulnerabilities.extend(text_issues)
         
+        # Count severities in a single pass
+        severity_counts = Counter(v['severity'] for v in vulnerabilities)
+        
         return {
             'vulnerabilities': vulnerabilities,
             'scan_summary': {
                 'total_issues': len(vulnerabilities),
-                'high_severity': len([v for v in vulnerabilities if v['severity'] == 'high']),
-                'medium_severity': len([v for v in vulnerabilities if v['severity'] == 'medium']),
-                'low_severity': len([v for v in vulnerabilities if v['severity'] == 'low'])
+                'high_severity': severity_counts['high'],
+                'medium_severity': severity_counts['medium'],
+                'low_severity': severity_counts['low']
             }
         }
     
@@ -61,11 +94,11 @@ class MalwareScanner:
                 content = f.read()
                 
                 for pattern in self.suspicious_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
+                    if pattern.search(content):
                         issues.append({
                             'type': 'Suspicious Binary Pattern',
                             'severity': 'high',
-                            'description': f'Suspicious pattern detected in file binary: {pattern.decode("utf-8", errors="ignore")}',
+                            'description': f'Suspicious pattern detected in file binary: {pattern.pattern.decode("utf-8", errors="ignore")}',
                             'recommendation': 'File may contain embedded malicious code. Verify source and scan with antivirus.'
                         })
                 
@@ -110,40 +143,22 @@ class MalwareScanner:
         issues = []
         
         # Check for script injection attempts
-        script_patterns = [
-            r'<script[^>]*>.*?</script>',
-            r'javascript:',
-            r'vbscript:',
-            r'data:text/html',
-            r'eval\s*\(',
-            r'document\.write\s*\(',
-        ]
-        
-        for pattern in script_patterns:
-            if re.search(pattern, text, re.IGNORECASE | re.DOTALL):
+        for pattern in self.script_patterns:
+            if pattern.search(text):
                 issues.append({
                     'type': 'Script Injection',
                     'severity': 'high',
-                    'description': f'Potential script injection detected: {pattern}',
+                    'description': f'Potential script injection detected: {pattern.pattern}',
                     'recommendation': 'Remove or sanitize suspicious script content.'
                 })
         
         # Check for command injection attempts
-        command_patterns = [
-            r'cmd\.exe',
-            r'powershell',
-            r'bash\s+-c',
-            r'sh\s+-c',
-            r'system\s*\(',
-            r'exec\s*\(',
-        ]
-        
-        for pattern in command_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in self.command_patterns:
+            if pattern.search(text):
                 issues.append({
                     'type': 'Command Injection',
                     'severity': 'high',
-                    'description': f'Potential command injection detected: {pattern}',
+                    'description': f'Potential command injection detected: {pattern.pattern}',
                     'recommendation': 'Remove suspicious command references.'
                 })
         
@@ -1,17 +1,42 @@
 import re
+from collections import defaultdict
 from typing import Dict, List, Any
 
+# Personal information patterns (compiled once at import time)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_SSN_RE = re.compile(r'\b\d{3}-\d{2}-\d{4}\b')
+_CREDIT_CARD_RE = re.compile(r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b')
+_ADDRESS_RE = re.compile(r'\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr)')
+_DATE_OF_BIRTH_RE = re.compile(r'\b(?:\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}|\d{4}[/\-]\d{1,2}[/\-]\d{1,2})\b')
+
+_PATTERNS = {
+    'email': _EMAIL_RE,
+    'phone': _PHONE_RE,
+    'ssn': _SSN_RE,
+    'credit_card': _CREDIT_CARD_RE,
+    'address': _ADDRESS_RE,
+    'date_of_birth': _DATE_OF_BIRTH_RE,
+}
+
+# The email and number patterns are fused into one alternation so the text is scanned in a
+# single pass. Email comes first since it needs an '@' and so cannot steal another type's
+# match, while e.g. a phone alternative would swallow the digits of 5551234567@vtext.com.
+# The most specific number formats follow so an SSN is not reported as a phone number.
+_COMBINED_ORDER = ['email', 'ssn', 'credit_card', 'date_of_birth', 'phone']
+_COMBINED_RE = re.compile('|'.join(f'(?P<{key}>{_PATTERNS[key].pattern})' for key in _COMBINED_ORDER))
+
+# Address stays a separate pass: it spans newlines and ends at the last street suffix, which
+# can sit inside the next word, so as part of the alternation it would consume a following
+# email ("12 Main Street\nDrew@example.com" ends at "Dr").
+_SEPARATE_TYPES = ['address']
+
 class PrivacyScanner:
     def __init__(self):
         # Personal information patterns
-        self.patterns = {
-            'email': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
-            'phone': re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),
-            'ssn': re.compile(r'\b\d{3}-\d{2}-\d{4}\b'),
-            'credit_card': re.compile(r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b'),
-            'address': re.compile(r'\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr)'),
-            'date_of_birth': re.compile(r'\b(?:\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}|\d{4}[/\-]\d{1,2}[/\-]\d{1,2})\b'),
-        }
+        self.patterns = _PATTERNS
+        self.combined_pattern = _COMBINED_RE
+        self.separate_patterns = {info_type: _PATTERNS[info_type] for info_type in _SEPARATE_TYPES}
         
         # Privacy risk levels
         self.risk_levels = {
@@ -28,14 +53,28 @@ class PrivacyScanner:
         text = parsed_content.get('text', '')
         issues = []
         
-        for info_type, pattern in self.patterns.items():
-            matches = pattern.findall(text)
-            if matches:
+        # Count every match but keep only the first 3 examples per type
+        counts = defaultdict(int)
+        examples = defaultdict(list)
+        
+        def record(info_type: str, match: re.Match) -> None:
+            counts[info_type] += 1
+            if len(examples[info_type]) < 3:
+                examples[info_type].append(match.group(0))
+        
+        for match in self.combined_pattern.finditer(text):
+            record(match.lastgroup, match)
+        for info_type, pattern in self.separate_patterns.items():
+            for match in pattern.finditer(text):
+                record(info_type, match)
+        
+        for info_type in self.patterns:
+            if counts[info_type]:
                 issues.append({
                     'type': info_type.replace('_', ' ').title(),
-                    'count': len(matches),
+                    'count': counts[info_type],
                     'risk_level': self.risk_levels.get(info_type, 'low'),
-                    'examples': matches[:3],  # Show first 3 examples
+                    'examples': examples[info_type],  # Show first 3 examples
                     'recommendation': self._get_recommendation(info_type)
                 })
         
@@ -47,7 +86,7 @@ class PrivacyScanner:
             'risk_level': risk_level,
             'summary': {
                 'total_types': len(issues),
-                'high_risk_items': len([i for i in issues if i['risk_level'] == 'high']),
+                'high_risk_items': sum(1 for i in issues if i['risk_level'] == 'high'),
                 'total_exposures': sum(issue['count'] for issue in issues)
             }
         }